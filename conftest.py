@@ -19,7 +19,7 @@ import re
 import shutil
 import sys
 from datetime import datetime
-from typing import Generator, AsyncGenerator, List
+from typing import Generator, AsyncGenerator, List, Optional
 
 import allure
 import pytest
@@ -112,8 +112,38 @@ async def browser(playwright: Playwright) -> AsyncGenerator[Browser, None]:
     yield browser
     await browser.close()
 
+@pytest_asyncio.fixture(scope="session")
+async def auth_storage_state(browser: Browser, tmp_path_factory: pytest.TempPathFactory) -> str:
+    """
+    Logs in once per session and saves the authenticated storage state.
+    
+    Uses BASE_URL, TEST_USERNAME and TEST_PASSWORD. Tests marked with
+    @pytest.mark.logged_in start from this state instead of logging in again.
+    """
+    state_path = tmp_path_factory.mktemp("auth") / "storage_state.json"
+    context = await browser.new_context(ignore_https_errors=True)
+    try:
+        page = await context.new_page()
+        await LoginPage(page).login(
+            Config.get_test_username(),
+            Config.get_test_password(),
+            base_url=Config.get_base_url(),
+        )
+        await context.storage_state(path=str(state_path))
+    finally:
+        await context.close()
+    logger.info(f"Authenticated storage state saved: {state_path}")
+    return str(state_path)
+
+@pytest.fixture(scope="function")
+def storage_state(request: pytest.FixtureRequest) -> Optional[str]:
+    """Returns the saved auth state for tests marked logged_in, None otherwise."""
+    if request.node.get_closest_marker("logged_in"):
+        return request.getfixturevalue("auth_storage_state")
+    return None
+
 @pytest_asyncio.fixture(scope="function")
-async def context(browser: Browser) -> AsyncGenerator[BrowserContext, None]:
+async def context(browser: Browser, storage_state: Optional[str]) -> AsyncGenerator[BrowserContext, None]:
     """
     Creates a new isolated browser context per test.
     
@@ -121,6 +151,9 @@ async def context(browser: Browser) -> AsyncGenerator[BrowserContext, None]:
     - VIEWPORT_WIDTH, VIEWPORT_HEIGHT: Browser viewport size
     - BROWSER_LOCALE: Browser locale (e.g., en-US, es-ES)
     - USER_AGENT: Custom user agent string
+    
+    Tests marked with @pytest.mark.logged_in get a context that already
+    carries the session-wide login state.
     """
     # Get configuration from Config
     viewport = Config.get_viewport_size()
@@ -132,6 +165,7 @@ async def context(browser: Browser) -> AsyncGenerator[BrowserContext, None]:
         locale=locale,
         user_agent=user_agent,
         ignore_https_errors=True,
+        storage_state=storage_state,
     )
     yield context
     await context.close()
@@ -150,6 +184,19 @@ def clean_screenshots() -> None:
     os.makedirs(screenshots_dir, exist_ok=True)
     logger.info(f"Screenshots directory cleaned: {screenshots_dir}")
 
+# --- Test file fixtures -------------------------------------------------------
+@pytest.fixture(scope="session")
+def upload_test_file(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """
+    Creates a file for upload tests once per session.
+    
+    The file lives in a pytest-managed temporary directory, so tests can share
+    it without creating and unlinking their own copy on every run.
+    """
+    file_path = tmp_path_factory.mktemp("uploads") / "payload.txt"
+    file_path.write_text("Test file content for automation", encoding="utf-8")
+    return str(file_path)
+
 # --- Pages registry -----------------------------------------------------------
 @pytest_asyncio.fixture(scope="function")
 async def pages_registry() -> AsyncGenerator[List[Page], None]:
@@ -9,12 +9,21 @@ Author: Erick Guadalupe Félix Flores
 License: MIT
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy import text
+from sqlalchemy.sql.expression import Executable
 import os
 
 
+Query = Union[str, Executable]
+
+
+def _as_statement(query: Query) -> Executable:
+    """Wrap raw SQL strings in text(); pass prebuilt statements through untouched."""
+    return text(query) if isinstance(query, str) else query
+
+
 class DatabaseClient:
     """
     Async database client using SQLAlchemy.
@@ -58,13 +67,27 @@ class DatabaseClient:
         
         return templates.get(db_type, templates["postgresql"])
     
+    def _build_connect_args(self) -> Dict[str, Any]:
+        """Build driver-specific connection arguments."""
+        if self.connection_string.startswith("postgresql+asyncpg"):
+            return {
+                # Short test queries gain nothing from the Postgres JIT, it only adds planning latency
+                "server_settings": {"jit": "off", "application_name": "pytest"},
+                # SQLAlchemy's asyncpg dialect prepares statements itself and caches
+                # them per connection under this key (default 100); asyncpg's own
+                # statement_cache_size does not apply to that path
+                "prepared_statement_cache_size": 1024,
+            }
+        return {}
+    
     async def connect(self) -> None:
         """Establish database connection with connection pooling."""
         self.engine = create_async_engine(
             self.connection_string,
             echo=False,
             pool_size=5,
-            max_overflow=10
+            max_overflow=10,
+            connect_args=self._build_connect_args()
         )
         self.session_maker = async_sessionmaker(
             self.engine,
@@ -77,12 +100,12 @@ class DatabaseClient:
         if self.engine:
             await self.engine.dispose()
     
-    async def execute(self, query: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    async def execute(self, query: Query, params: Optional[Dict[str, Any]] = None) -> Any:
         """
         Execute a query (INSERT, UPDATE, DELETE).
         
         Args:
-            query: SQL query string
+            query: SQL query string or a prebuilt SQLAlchemy statement
             params: Query parameters (optional)
             
         Returns:
@@ -95,16 +118,16 @@ class DatabaseClient:
             )
         """
         async with self.session_maker() as session:
-            result = await session.execute(text(query), params or {})
+            result = await session.execute(_as_statement(query), params or {})
             await session.commit()
             return result
     
-    async def fetch_one(self, query: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    async def fetch_one(self, query: Query, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
         Fetch a single row from database.
         
         Args:
-            query: SQL query string
+            query: SQL query string or a prebuilt SQLAlchemy statement
             params: Query parameters (optional)
             
         Returns:
@@ -117,18 +140,18 @@ class DatabaseClient:
             )
         """
         async with self.session_maker() as session:
-            result = await session.execute(text(query), params or {})
+            result = await session.execute(_as_statement(query), params or {})
             row = result.fetchone()
             if row:
                 return dict(row._mapping)
             return None
     
-    async def fetch_all(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    async def fetch_all(self, query: Query, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Fetch all rows from database.
         
         Args:
-            query: SQL query string
+            query: SQL query string or a prebuilt SQLAlchemy statement
             params: Query parameters (optional)
             
         Returns:
@@ -141,6 +164,33 @@ class DatabaseClient:
             )
         """
         async with self.session_maker() as session:
-            result = await session.execute(text(query), params or {})
+            result = await session.execute(_as_statement(query), params or {})
             rows = result.fetchall()
             return [dict(row._mapping) for row in rows]
+    
+    async def delete_returning(self, query: Query, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Execute a DELETE ... RETURNING query and return the deleted rows.
+        
+        Combines the delete and the follow-up lookup into one round-trip.
+        Requires a database with RETURNING support (e.g. PostgreSQL).
+        
+        Args:
+            query: SQL DELETE statement with a RETURNING clause, or a prebuilt SQLAlchemy statement
+            params: Query parameters (optional)
+            
+        Returns:
+            List of deleted rows as dictionaries
+            
+        Example:
+            deleted = await db.delete_returning(
+                "DELETE FROM users WHERE email = :email RETURNING id",
+                {"email": "test@test.com"}
+            )
+            assert len(deleted) == 1
+        """
+        async with self.session_maker() as session:
+            result = await session.execute(_as_statement(query), params or {})
+            rows = [dict(row._mapping) for row in result.fetchall()]
+            await session.commit()
+            return rows
@@ -457,7 +457,7 @@ class BasePage:
                                     - str, int, float: for text or number fields
                                     - bool: for checkboxes or radio buttons
                                     - list: for multiple expected values in inputs or nested structures
-                                    - set: for verifying visible options in Select2 elements
+                                    - set/frozenset: for verifying visible options in Select2 elements
 
         Behavior:
             1. Iterates through each field in `data_validate`.
@@ -467,7 +467,7 @@ class BasePage:
                 - `<INPUT>`:
                     - Checkbox/Radio: validates checked state.
                     - Number/Text: validates value (supports list of expected values).
-                - `<SPAN>` with set: checks visibility of each option (useful for Select2).
+                - `<SPAN>` with set/frozenset: checks visibility of each option (useful for Select2).
                 - Nested lists: recursively validates each nested item.
             4. Raises an assertion error if any field does not match the expected value.
 
@@ -517,10 +517,12 @@ class BasePage:
                     else:
                         await expect(field_input).to_have_value(expected_value)
 
-            elif tag_name == 'SPAN' and isinstance(expected_value, set):
-                for option in expected_value:
-                    option_locator = self.page.locator(f'.select2-results__option:has-text("{option}")')
-                    await expect(option_locator).to_be_visible()
+            elif tag_name == 'SPAN' and isinstance(expected_value, (set, frozenset)):
+                # Options are independent, so check them concurrently instead of one by one
+                await asyncio.gather(*(
+                    expect(self.page.locator(f'.select2-results__option:has-text("{option}")')).to_be_visible()
+                    for option in expected_value
+                ))
 
             elif isinstance(expected_value, list):
                 for fila_data in expected_value:
@@ -539,7 +541,7 @@ class BasePage:
                                 Supported value types:
                                     - str, int, float: for single value fields.
                                     - bool: for checkbox fields.
-                                    - set: for verifying multiple visible options.
+                                    - set/frozenset: for verifying multiple visible options.
                                     - dict: for nested structures, such as Select2 with multiple sub-values.
 
         Behavior:
@@ -578,16 +580,16 @@ class BasePage:
             locator_count = await final_locator.count()
 
             if locator_count > 1:
-                for i in range(locator_count):
-                    await expect(final_locator.nth(i)).to_contain_text(value)
+                # One list assertion checks every match in a single browser round-trip
+                await expect(final_locator).to_contain_text([value] * locator_count)
             else:
                 await expect(final_locator.first).to_contain_text(value)
 
         # Iterate over all fields to validate
         for field_selector, expected_value in data_validate.items():
 
-            # Case 1: multiple values (set)
-            if isinstance(expected_value, set):
+            # Case 1: multiple values (set or frozenset)
+            if isinstance(expected_value, (set, frozenset)):
                 for value in expected_value:
                     await _validate_text(value)
 
@@ -744,21 +746,25 @@ class BasePage:
         except Exception as e:
             raise ElementNotFoundError(selector, timeout=5000) from e
 
-    async def wait_for_selector(self, selector: str, time_sleep: float = 0.05, timeout: int = 30000) -> None:
+    async def wait_for_selector(self, selector: str, time_sleep: float = 0.0, timeout: int = 30000) -> None:
         """
         Waits for an element to appear on the page.
         
+        Returns as soon as the element becomes visible; no fixed settle delay
+        is added unless time_sleep is given.
+        
         Args:
             selector (str): Element selector to wait for.
-            time_sleep (float): Additional sleep time after element appears.
+            time_sleep (float): Optional extra sleep time after element appears.
             timeout (int): Timeout in milliseconds.
             
         Raises:
             ElementNotFoundError: if element is not found within timeout.
         """
         try:
-            await self.page.wait_for_selector(selector, timeout=timeout)
-            await asyncio.sleep(time_sleep)
+            await self.page.locator(selector).first.wait_for(state="visible", timeout=timeout)
+            if time_sleep:
+                await asyncio.sleep(time_sleep)
         except PlaywrightTimeoutError as e:
             logger.error(f"Element not found: {selector}")
             raise ElementNotFoundError(selector, timeout=timeout) from e
@@ -1238,6 +1244,10 @@ class BasePage:
         Returns:
             str: The actual dialog message text
             
+        Raises:
+            ValidationError: If dialog_text is given and the dialog message doesn't contain it
+                (the dialog is dismissed, never accepted)
+            
         Example:
             message = await page.handle_confirmation_dialog(
                 lambda: page.click('#delete-button'),
@@ -1251,11 +1261,11 @@ class BasePage:
             nonlocal dialog_message
             dialog_message = dialog.message
             
+            # Never confirm a dialog that failed validation; the error is raised
+            # after trigger_action returns so the dialog doesn't block it
             if dialog_text and dialog_text not in dialog_message:
-                raise ValidationError("dialog_validation", 
-                                    f"Expected dialog text '{dialog_text}' but got '{dialog_message}'")
-            
-            if accept:
+                await dialog.dismiss()
+            elif accept:
                 await dialog.accept()
             else:
                 await dialog.dismiss()
@@ -1263,13 +1273,14 @@ class BasePage:
         self.page.on("dialog", dialog_handler)
         
         try:
-            if asyncio.iscoroutinefunction(trigger_action):
-                await trigger_action()
-            else:
-                await trigger_action()
+            await trigger_action()
         finally:
             self.page.remove_listener("dialog", dialog_handler)
         
+        if dialog_text and dialog_text not in (dialog_message or ""):
+            raise ValidationError("dialog_validation", 
+                                f"Expected dialog text '{dialog_text}' but got '{dialog_message}'")
+        
         return dialog_message or ""
 
     async def close_modal_by_escape(self, modal_selector: str) -> None:
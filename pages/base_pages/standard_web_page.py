@@ -257,7 +257,7 @@ class StandardWebPage(BasePage):
 
         validation_actions = {
             ValidationType.MAX_LENGTH.value: self.remove_max_length_attribute,
-            ValidationType.MIN.value: self.remove_min_length_attribute,
+            ValidationType.MIN_LENGTH.value: self.remove_min_length_attribute,
             ValidationType.MAX.value: self.remove_max_attribute,
             ValidationType.MIN.value: self.remove_min_attribute,
             ValidationType.DATA_TYPE.value: self.remove_type_attribute,
@@ -396,7 +396,7 @@ class StandardWebPage(BasePage):
 
     async def validate_button_operations(
         self,
-        operation_type: str,
+        operation_type: ButtonOperations,
         form_method: Callable[..., Any],
         data: dict = None
     ) -> None:
@@ -407,16 +407,17 @@ class StandardWebPage(BasePage):
         to their respective handlers and executes the corresponding validation flow.
 
         Args:
-            operation_type (str): Type of button operation to perform.
+            operation_type (ButtonOperations): Type of button operation to perform.
             form_method (Callable[..., Any]): Method that navigates to the target form or view.
             data (Dict[str, Any] | None): Optional data to validate record information.
 
         Raises:
+            TypeError: If operation_type is not a ButtonOperations member.
             ValueError: If the provided operation_type is not supported.
 
         Example:
             >>> await self.validate_button_operations(
-                operation_type=ButtonOperations.CANCEL_CREATE.value,
+                operation_type=ButtonOperations.CANCEL_CREATE,
                 form_method=self.goto_create_form
             )
         """
@@ -15,8 +15,7 @@ License: MIT
 from playwright.async_api import Page
 from pages.base_pages.standard_web_page import StandardWebPage
 from utils.test_helpers import TestDataGenerator
-from typing import Optional, Callable
-import random
+from typing import Optional
 
 
 class DemoPage(StandardWebPage):
@@ -109,14 +108,15 @@ class DemoPage(StandardWebPage):
             ... )
         """
         # Generate or use provided values using TestDataGenerator
-        first_name = kwargs.get('first_name', TestDataGenerator.random_string(8).title())
-        last_name = kwargs.get('last_name', TestDataGenerator.random_string(10).title())
-        email = kwargs.get('email', TestDataGenerator.random_email())
-        phone = kwargs.get('phone', TestDataGenerator.random_phone())
-        role = kwargs.get('role', random.choice(['User', 'Admin', 'Manager']))
-        department = kwargs.get('department', random.choice(['Engineering', 'Sales', 'Marketing', 'HR']))
+        # (random defaults are only generated for fields that were not overridden)
+        first_name = kwargs['first_name'] if 'first_name' in kwargs else TestDataGenerator.random_capitalized(8)
+        last_name = kwargs['last_name'] if 'last_name' in kwargs else TestDataGenerator.random_capitalized(10)
+        email = kwargs['email'] if 'email' in kwargs else TestDataGenerator.random_email()
+        phone = kwargs['phone'] if 'phone' in kwargs else TestDataGenerator.random_phone()
+        role = kwargs['role'] if 'role' in kwargs else TestDataGenerator.random_choice(['User', 'Admin', 'Manager'])
+        department = kwargs['department'] if 'department' in kwargs else TestDataGenerator.random_choice(['Engineering', 'Sales', 'Marketing', 'HR'])
         active = kwargs.get('active', True)
-        notes = kwargs.get('notes', f"Auto-generated demo user - {TestDataGenerator.random_string(15)}")
+        notes = kwargs['notes'] if 'notes' in kwargs else f"Auto-generated demo user - {TestDataGenerator.random_string(15)}"
         
         # Create data dictionary (for fill_data)
         self.data = {
@@ -339,7 +339,7 @@ async def test_basic_authentication(api_client: APIClient):
 # FILE UPLOAD & DOWNLOAD EXAMPLES
 # ============================================================================
 @pytest.mark.asyncio
-async def test_file_upload(api_client: APIClient):
+async def test_file_upload(api_client: APIClient, upload_test_file: str):
     """
     Upload a file to the API.
     
@@ -353,7 +353,7 @@ async def test_file_upload(api_client: APIClient):
     # Upload file
     response = await api_client.upload_file(
         endpoint="/users/profile/avatar",
-        file_path="test_data/sample_image.jpg",
+        file_path=upload_test_file,
         field_name="avatar",
         data={"user_id": "123", "public": "true"}
     )
@@ -194,7 +194,7 @@ async def test_new_tab_handling(page: Page):
     await page.goto("https://example.com")
     
     # Open new tab
-    async with page.context.expect_page() as new_page_info:
+    async with page.context.expect_page():
         await demo_page.click_new_tab_link()
     
     # Switch to new tab
@@ -9,14 +9,101 @@ License: MIT
 """
 
 import os
+from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables from .env file if it exists
+# Load environment variables from .env file if it exists.
+# DOTENV_LOADED is inherited by child processes (e.g. pytest-xdist workers),
+# so only the first process parses the file; existing variables always win.
 env_path = Path(__file__).parent.parent / '.env'
-if env_path.exists():
-    load_dotenv(env_path)
+if env_path.exists() and not os.environ.get('DOTENV_LOADED'):
+    load_dotenv(env_path, override=False)
+    os.environ['DOTENV_LOADED'] = '1'
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/91.0.4472.124 Safari/537.36"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _ConfigSnapshot:
+    """Immutable, already-parsed view of the environment configuration."""
+    base_url: str
+    test_username: str
+    test_password: str
+    db_testing_enabled: bool
+    db_type: str
+    db_host: str
+    db_port: str
+    db_name: str
+    db_user: str
+    db_password: str
+    redis_host: str
+    redis_port: str
+    redis_db: int
+    browser_type: str
+    headless: bool
+    viewport_width: int
+    viewport_height: int
+    browser_locale: str
+    user_agent: str
+    test_timeout: int
+    pytest_workers: str
+    screenshot_on_failure: bool
+    screenshots_dir: str
+    discord_webhook_url: Optional[str]
+
+
+def _env_flag(name: str, default: str) -> bool:
+    """Parse a 'true'/'false' environment variable."""
+    return os.environ.get(name, default).lower() == 'true'
+
+
+def _env_int(name: str, default: int) -> int:
+    """Parse an integer environment variable, falling back to default if invalid."""
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _load_snapshot() -> _ConfigSnapshot:
+    """Read and parse every configuration value from the environment in one pass."""
+    env = os.environ
+
+    return _ConfigSnapshot(
+        base_url=env.get('BASE_URL', 'http://localhost:8000'),
+        test_username=env.get('TEST_USERNAME', 'test_user'),
+        test_password=env.get('TEST_PASSWORD', 'test_password'),
+        db_testing_enabled=_env_flag('DB_TEST', 'false'),
+        db_type=env.get('DB_TYPE', 'postgresql'),
+        db_host=env.get('DB_HOST', 'localhost'),
+        db_port=env.get('DB_PORT', '5432'),
+        db_name=env.get('DB_NAME', 'testdb'),
+        db_user=env.get('DB_USER', 'postgres'),
+        db_password=env.get('DB_PASSWORD', 'password'),
+        redis_host=env.get('REDIS_HOST', 'localhost'),
+        redis_port=env.get('REDIS_PORT', '6379'),
+        redis_db=_env_int('REDIS_DB', 0),
+        browser_type=env.get('BROWSER', 'chromium'),
+        headless=_env_flag('HEADLESS', 'true'),
+        viewport_width=_env_int('VIEWPORT_WIDTH', 1920),
+        viewport_height=_env_int('VIEWPORT_HEIGHT', 1080),
+        browser_locale=env.get('BROWSER_LOCALE', 'en-US'),
+        user_agent=env.get('USER_AGENT', DEFAULT_USER_AGENT),
+        test_timeout=_env_int('TIMEOUT', 30000),
+        pytest_workers=env.get('PYTEST_WORKERS', 'auto'),
+        screenshot_on_failure=_env_flag('SCREENSHOT_ON_FAILURE', 'true'),
+        screenshots_dir=env.get('SCREENSHOTS_DIR', 'screenshots'),
+        discord_webhook_url=env.get('DISCORD_WEBHOOK_URL'),
+    )
+
+
+_snapshot = _load_snapshot()
 
 
 class Config:
@@ -25,59 +112,62 @@ class Config:
     
     This class provides a single source of truth for all configuration values,
     with sensible defaults and easy customization via environment variables.
+    
+    Values are read from the environment once, at import time; call
+    Config.reload() after changing environment variables at runtime.
     """
     
     # ========== Application Settings ==========
     @staticmethod
     def get_base_url() -> str:
         """Get the base URL for the application under test."""
-        return os.getenv('BASE_URL', 'http://localhost:8000')
+        return _snapshot.base_url
     
     @staticmethod
     def get_test_username() -> str:
         """Get the test username."""
-        return os.getenv('TEST_USERNAME', 'test_user')
+        return _snapshot.test_username
     
     @staticmethod
     def get_test_password() -> str:
         """Get the test password."""
-        return os.getenv('TEST_PASSWORD', 'test_password')
+        return _snapshot.test_password
     
     # ========== Database Settings ==========
     @staticmethod
     def is_db_testing_enabled() -> bool:
         """Check if database testing is enabled."""
-        return os.getenv('DB_TEST', 'false').lower() == 'true'
+        return _snapshot.db_testing_enabled
     
     @staticmethod
     def get_db_type() -> str:
         """Get database type (postgresql, mysql, mssql, oracle)."""
-        return os.getenv('DB_TYPE', 'postgresql')
+        return _snapshot.db_type
     
     @staticmethod
     def get_db_host() -> str:
         """Get database host."""
-        return os.getenv('DB_HOST', 'localhost')
+        return _snapshot.db_host
     
     @staticmethod
     def get_db_port() -> str:
         """Get database port."""
-        return os.getenv('DB_PORT', '5432')
+        return _snapshot.db_port
     
     @staticmethod
     def get_db_name() -> str:
         """Get database name."""
-        return os.getenv('DB_NAME', 'testdb')
+        return _snapshot.db_name
     
     @staticmethod
     def get_db_user() -> str:
         """Get database username."""
-        return os.getenv('DB_USER', 'postgres')
+        return _snapshot.db_user
     
     @staticmethod
     def get_db_password() -> str:
         """Get database password."""
-        return os.getenv('DB_PASSWORD', 'password')
+        return _snapshot.db_password
     
     # ========== Redis Settings ==========
     @staticmethod
@@ -88,27 +178,22 @@ class Config:
         Returns:
             Dictionary with Redis connection parameters
         """
-        try:
-            redis_db = int(os.getenv('REDIS_DB', '0'))
-        except ValueError:
-            redis_db = 0  # Default to 0 if invalid value
-            
         return {
-            'host': os.getenv('REDIS_HOST', 'localhost'),
-            'port': os.getenv('REDIS_PORT', '6379'),
-            'db': redis_db
+            'host': _snapshot.redis_host,
+            'port': _snapshot.redis_port,
+            'db': _snapshot.redis_db
         }
     
     # ========== Browser Settings ==========
     @staticmethod
     def get_browser_type() -> str:
         """Get the browser type (chromium, firefox, webkit)."""
-        return os.getenv('BROWSER', 'chromium')
+        return _snapshot.browser_type
     
     @staticmethod
     def is_headless() -> bool:
         """Check if browser should run in headless mode."""
-        return os.getenv('HEADLESS', 'true').lower() == 'true'
+        return _snapshot.headless
     
     @staticmethod
     def get_viewport_size() -> Dict[str, int]:
@@ -119,76 +204,82 @@ class Config:
             Dictionary with width and height
         """
         return {
-            'width': int(os.getenv('VIEWPORT_WIDTH', '1920')),
-            'height': int(os.getenv('VIEWPORT_HEIGHT', '1080'))
+            'width': _snapshot.viewport_width,
+            'height': _snapshot.viewport_height
         }
     
     @staticmethod
     def get_browser_locale() -> str:
         """Get browser locale."""
-        return os.getenv('BROWSER_LOCALE', 'en-US')
+        return _snapshot.browser_locale
     
     @staticmethod
     def get_user_agent() -> str:
         """Get custom user agent string."""
-        default_ua = (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/91.0.4472.124 Safari/537.36"
-        )
-        return os.getenv('USER_AGENT', default_ua)
+        return _snapshot.user_agent
     
     # ========== Test Execution Settings ==========
     @staticmethod
     def get_test_timeout() -> int:
         """Get test timeout in milliseconds."""
-        return int(os.getenv('TIMEOUT', '30000'))
+        return _snapshot.test_timeout
     
     @staticmethod
     def get_pytest_workers() -> str:
         """Get number of pytest workers for parallel execution."""
-        return os.getenv('PYTEST_WORKERS', 'auto')
+        return _snapshot.pytest_workers
     
     @staticmethod
     def should_screenshot_on_failure() -> bool:
         """Check if screenshots should be taken on test failure."""
-        return os.getenv('SCREENSHOT_ON_FAILURE', 'true').lower() == 'true'
+        return _snapshot.screenshot_on_failure
     
     # ========== Reporting Settings ==========
     @staticmethod
     def get_screenshots_dir() -> str:
         """Get screenshots directory path."""
-        return os.getenv('SCREENSHOTS_DIR', 'screenshots')
+        return _snapshot.screenshots_dir
     
     @staticmethod
     def get_discord_webhook_url() -> Optional[str]:
         """Get Discord webhook URL for notifications."""
-        return os.getenv('DISCORD_WEBHOOK_URL')
+        return _snapshot.discord_webhook_url
     
     # ========== Helper Methods ==========
+    @staticmethod
+    def reload() -> None:
+        """
+        Re-read all configuration values from the environment.
+        
+        Useful when tests change environment variables at runtime.
+        """
+        global _snapshot
+        _snapshot = _load_snapshot()
+    
     @staticmethod
     def get_all_config() -> Dict[str, Any]:
         """
         Get all configuration as a dictionary.
         
         Useful for debugging and logging configuration state.
+        Credentials are intentionally left out.
         
         Returns:
             Dictionary with all configuration values
         """
         return {
-            'base_url': Config.get_base_url(),
-            'test_username': Config.get_test_username(),
-            'db_testing_enabled': Config.is_db_testing_enabled(),
-            'db_type': Config.get_db_type(),
-            'db_host': Config.get_db_host(),
-            'browser_type': Config.get_browser_type(),
-            'headless': Config.is_headless(),
+            'base_url': _snapshot.base_url,
+            'test_username': _snapshot.test_username,
+            'db_testing_enabled': _snapshot.db_testing_enabled,
+            'db_type': _snapshot.db_type,
+            'db_host': _snapshot.db_host,
+            'browser_type': _snapshot.browser_type,
+            'headless': _snapshot.headless,
             'viewport': Config.get_viewport_size(),
-            'locale': Config.get_browser_locale(),
-            'test_timeout': Config.get_test_timeout(),
-            'pytest_workers': Config.get_pytest_workers(),
-            'screenshots_dir': Config.get_screenshots_dir(),
+            'locale': _snapshot.browser_locale,
+            'test_timeout': _snapshot.test_timeout,
+            'pytest_workers': _snapshot.pytest_workers,
+            'screenshots_dir': _snapshot.screenshots_dir,
         }
     
     @staticmethod
@@ -198,7 +289,7 @@ class Config:
         
         Returns:
             True if all required config is present, raises ValueError otherwise
-            
+        
         Raises:
             ValueError: If required configuration is missing
         """
@@ -218,4 +309,4 @@ class Config:
 
 
 # Singleton instance for easy access
-config = Config()
\ No newline at end of file
+config = Config()
@@ -1,12 +1,14 @@
-from enum import Enum
+from enum import Enum, unique
 
-class FilterType(Enum):
+@unique
+class FilterType(str, Enum):
     """Enumeration for different filter types used in filtering."""
     INVALID = "invalid"
     EMPTY = "empty"
     CLEAR = "clear"
 
-class ValidationType(Enum):
+@unique
+class ValidationType(str, Enum):
     """Enumeration for different edit types used in editing operations."""
     REQUIRED = "required"
     PATTERN = "pattern"
@@ -19,7 +21,8 @@ class ValidationType(Enum):
     CUSTOM = "custom"
     DISABLED = "disabled"
 
-class ButtonOperations(Enum):
+@unique
+class ButtonOperations(str, Enum):
     """Enumeration for different cancel/back button operations"""
     CANCEL_CREATE = "cancel_create"
     CANCEL_EDIT = "cancel_edit" 
@@ -31,4 +34,4 @@ class ButtonOperations(Enum):
     BACK_DISABLED = "back_disabled"
     BACK_DETAIL_DISABLED = "back_detail_disabled"
     BACK_COPY = "back_copy"
-    CANCEL_COPY = "back_copy"
\ No newline at end of file
+    CANCEL_COPY = "cancel_copy"
\ No newline at end of file
@@ -19,16 +19,16 @@ class ElementNotFoundError(Exception):
     but are not found within the specified timeout period.
     """
     
+    # Message templates keyed by bool(timeout)
+    _FMT = {
+        True: "Element '{selector}' not found within {timeout}ms timeout",
+        False: "Element '{selector}' not found",
+    }
+    
     def __init__(self, selector: str, timeout: Optional[int] = None) -> None:
         self.selector = selector
         self.timeout = timeout
-        
-        if timeout:
-            message = f"Element '{selector}' not found within {timeout}ms timeout"
-        else:
-            message = f"Element '{selector}' not found"
-            
-        super().__init__(message)
+        super().__init__(self._FMT[bool(timeout)].format(selector=selector, timeout=timeout))
 
 
 class ValidationError(Exception):
@@ -39,19 +39,19 @@ class ValidationError(Exception):
     issues during test execution.
     """
     
+    # Message templates keyed by (bool(field), bool(message))
+    _FMT = {
+        (True, True): "Validation error for field '{field}': {message}",
+        (True, False): "Validation error for field '{field}'",
+        (False, True): "Validation error: {message}",
+        (False, False): "Validation error occurred",
+    }
+    
     def __init__(self, field: Optional[str] = None, message: Optional[str] = None) -> None:
         self.field = field
-        
-        if field and message:
-            error_message = f"Validation error for field '{field}': {message}"
-        elif field:
-            error_message = f"Validation error for field '{field}'"
-        elif message:
-            error_message = f"Validation error: {message}"
-        else:
-            error_message = "Validation error occurred"
-            
-        super().__init__(error_message)
+        super().__init__(
+            self._FMT[(bool(field), bool(message))].format(field=field, message=message)
+        )
 
 
 class Select2Error(Exception):
@@ -62,16 +62,18 @@ class Select2Error(Exception):
     such as option not found, dropdown not opening, etc.
     """
     
+    # Message templates keyed by bool(message)
+    _FMT = {
+        True: "Select2 error on '{selector}' during '{operation}': {message}",
+        False: "Select2 error on '{selector}' during '{operation}'",
+    }
+    
     def __init__(self, selector: str, operation: str, message: str = None):
         self.selector = selector
         self.operation = operation
-        
-        if message:
-            error_message = f"Select2 error on '{selector}' during '{operation}': {message}"
-        else:
-            error_message = f"Select2 error on '{selector}' during '{operation}'"
-            
-        super().__init__(error_message)
+        super().__init__(
+            self._FMT[bool(message)].format(selector=selector, operation=operation, message=message)
+        )
 
 
 class ConfigurationError(Exception):
@@ -82,19 +84,19 @@ class ConfigurationError(Exception):
     that prevent tests from running properly.
     """
     
+    # Message templates keyed by (bool(config_key), bool(message))
+    _FMT = {
+        (True, True): "Configuration error for '{config_key}': {message}",
+        (True, False): "Configuration error: missing or invalid '{config_key}'",
+        (False, True): "Configuration error: {message}",
+        (False, False): "Configuration error occurred",
+    }
+    
     def __init__(self, config_key: str = None, message: str = None):
         self.config_key = config_key
-        
-        if config_key and message:
-            error_message = f"Configuration error for '{config_key}': {message}"
-        elif config_key:
-            error_message = f"Configuration error: missing or invalid '{config_key}'"
-        elif message:
-            error_message = f"Configuration error: {message}"
-        else:
-            error_message = "Configuration error occurred"
-            
-        super().__init__(error_message)
+        super().__init__(
+            self._FMT[(bool(config_key), bool(message))].format(config_key=config_key, message=message)
+        )
 
 
 class DatabaseError(Exception):
@@ -105,19 +107,19 @@ class DatabaseError(Exception):
     query failures, or data validation problems.
     """
     
+    # Message templates keyed by (bool(operation), bool(message))
+    _FMT = {
+        (True, True): "Database error during '{operation}': {message}",
+        (True, False): "Database error during '{operation}'",
+        (False, True): "Database error: {message}",
+        (False, False): "Database error occurred",
+    }
+    
     def __init__(self, operation: str = None, message: str = None):
         self.operation = operation
-        
-        if operation and message:
-            error_message = f"Database error during '{operation}': {message}"
-        elif operation:
-            error_message = f"Database error during '{operation}'"
-        elif message:
-            error_message = f"Database error: {message}"
-        else:
-            error_message = "Database error occurred"
-            
-        super().__init__(error_message)
+        super().__init__(
+            self._FMT[(bool(operation), bool(message))].format(operation=operation, message=message)
+        )
 
 
 class RedisError(Exception):
@@ -128,19 +130,19 @@ class RedisError(Exception):
     cache operations failures, or data retrieval problems.
     """
     
+    # Message templates keyed by (bool(operation), bool(message))
+    _FMT = {
+        (True, True): "Redis error during '{operation}': {message}",
+        (True, False): "Redis error during '{operation}'",
+        (False, True): "Redis error: {message}",
+        (False, False): "Redis error occurred",
+    }
+    
     def __init__(self, operation: str = None, message: str = None):
         self.operation = operation
-        
-        if operation and message:
-            error_message = f"Redis error during '{operation}': {message}"
-        elif operation:
-            error_message = f"Redis error during '{operation}'"
-        elif message:
-            error_message = f"Redis error: {message}"
-        else:
-            error_message = "Redis error occurred"
-            
-        super().__init__(error_message)
+        super().__init__(
+            self._FMT[(bool(operation), bool(message))].format(operation=operation, message=message)
+        )
 
 class APIError(Exception):
     """Exception raised for API request failures."""
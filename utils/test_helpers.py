@@ -2,38 +2,213 @@
 Utility functions for test data generation and common test operations.
 """
 
+import csv
+import json
+import operator
 import random
+import shutil
+import stat
 import string
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+import time
+from datetime import date, datetime, timedelta
+from functools import cache, reduce
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple, Type, TypeVar
 import os
 
+T = TypeVar('T')
+
+try:
+    import numpy as np
+except ImportError:  # Optional: only used to speed up bulk generation
+    np = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON, falls back to the stdlib
+    orjson = None
+
+if orjson is not None:
+    def _json_dumps(data: Any) -> bytes:
+        """Serialize to indented UTF-8 JSON bytes."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(data: Any) -> bytes:
+        """Serialize to indented UTF-8 JSON bytes."""
+        return json.dumps(data, indent=2).encode('utf-8')
+    
+    _json_loads = json.loads
+
+# Character pools built once instead of on every call
+_LETTERS = string.ascii_letters
+_ALNUM = string.ascii_letters + string.digits
+_SPECIAL_CHARS = '!@#$%^&*'
+
+# Byte -> ASCII letter table for random_string (256 % 52 bias is fine for test data)
+_ALPHABET_TABLE = bytes((_LETTERS * 5)[:256], 'ascii')
+_LOWER_TABLE = bytes((string.ascii_lowercase * 10)[:256], 'ascii')
+_UPPER_TABLE = bytes((string.ascii_uppercase * 10)[:256], 'ascii')
+
+# Password alphabets keyed by (include_special, include_numbers, include_uppercase)
+_PWD_CACHE: Dict[Tuple[bool, bool, bool], str] = {}
+
+# Private generator for all test data; seed it with TestDataGenerator.seed()
+_rng = random.Random()
+_choices = _rng.choices
+
+# Characters not allowed in filenames, mapped to '_'
+_FILENAME_TRANSLATION = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+# Phone number formatters keyed by random_phone's format_type
+_PHONE_FORMATS = {
+    'us': lambda d: f"({d[:3]}) {d[3:6]}-{d[6:]}",
+    'international': lambda d: f"+1{d}",
+    'simple': lambda d: d,
+}
+
+# Exactly four entries so random_email can index with getrandbits(2)
+_EMAIL_DOMAINS = ('gmail.com', 'yahoo.com', 'hotmail.com', 'test.com')
+
+if np is not None:
+    _np_rng = np.random.default_rng()
+    _NP_LOWERCASE = np.frombuffer(string.ascii_lowercase.encode('ascii'), dtype='S1')
+
+_now = datetime.now
+_today = date.today
+_DEFAULT_DATE_FORMAT = '%Y-%m-%d'
+
+
+def _format_date(value: datetime, date_format: str) -> str:
+    """Format a date, using isoformat() for the default YYYY-MM-DD layout."""
+    if date_format == _DEFAULT_DATE_FORMAT:
+        return value.isoformat()[:10]
+    return value.strftime(date_format)
+
+
+# Directories resolved once at import instead of on every helper call
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_TEST_FILES_DIR = os.path.join(_MODULE_DIR, 'test')
+
+# Directory for files created by TestHelpers.create_temp_*; created lazily once
+_TEMP_DIR = os.path.join(_MODULE_DIR, 'temp')
+
+
+def _random_lower_string(length: int) -> str:
+    """Random lowercase letters, without a separate .lower() pass."""
+    return _rng.randbytes(length).translate(_LOWER_TABLE).decode('ascii')
+
+
+@cache
+def _ensure_temp_dir() -> str:
+    """Create the temp directory on first use and return its path."""
+    os.makedirs(_TEMP_DIR, exist_ok=True)
+    return _TEMP_DIR
+
+
+def _open_in_temp_dir(filename: str, opener: Callable[[str], T]) -> Tuple[str, T]:
+    """
+    Open filename inside the temp directory with opener(path).
+    
+    The directory is only created once per process; if another process (e.g. a
+    pytest-xdist worker running cleanup_temp_files) removed it since, recreate
+    it and retry once.
+    """
+    try:
+        file_path = os.path.join(_ensure_temp_dir(), filename)
+        return file_path, opener(file_path)
+    except FileNotFoundError:
+        _ensure_temp_dir.cache_clear()
+        file_path = os.path.join(_ensure_temp_dir(), filename)
+        return file_path, opener(file_path)
+
 
 class TestDataGenerator:
     """Utility class for generating test data."""
     
+    @staticmethod
+    def seed(value: Optional[int] = None) -> None:
+        """
+        Seed the generator behind every TestDataGenerator method.
+        
+        Args:
+            value: Seed for reproducible data; None reseeds from system entropy
+        """
+        global _np_rng
+        _rng.seed(value)
+        if np is not None:
+            _np_rng = np.random.default_rng(value)
+    
     @staticmethod
     def random_string(length: int = 10) -> str:
         """Generate a random string of specified length."""
-        return ''.join(random.choices(string.ascii_letters, k=length))
+        return _rng.randbytes(length).translate(_ALPHABET_TABLE).decode('ascii')
+    
+    @staticmethod
+    def random_strings(count: int, length: int = 10) -> List[str]:
+        """
+        Generate many random letter strings in one call.
+        
+        Draws and translates the bytes for the whole batch at once, then
+        slices them, instead of one RNG draw and translate per string.
+        
+        Args:
+            count: Number of strings to generate
+            length: Length of each string
+        """
+        if length <= 0:
+            return [''] * count
+        total = count * length
+        blob = _rng.randbytes(total).translate(_ALPHABET_TABLE).decode('ascii')
+        return [blob[i:i + length] for i in range(0, total, length)]
+    
+    @staticmethod
+    def random_capitalized(length: int = 8) -> str:
+        """Generate a random capitalized string (e.g. for names), without a .title() pass."""
+        raw = _rng.randbytes(length)
+        return (raw[:1].translate(_UPPER_TABLE) + raw[1:].translate(_LOWER_TABLE)).decode('ascii')
     
     @staticmethod
     def random_alphanumeric(length: int = 10) -> str:
         """Generate a random alphanumeric string."""
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+        return ''.join(_choices(_ALNUM, k=length))
     
     @staticmethod
     def random_digits(length: int = 10) -> str:
         """Generate a random string of digits."""
-        return ''.join(random.choices(string.digits, k=length))
+        if length <= 0:
+            return ''
+        # One draw over the whole range, zero-padded, instead of one draw per digit
+        return f"{_rng.randrange(10 ** length):0{length}d}"
     
     @staticmethod
     def random_email(domain: str = None) -> str:
         """Generate a random email address."""
-        username = TestDataGenerator.random_string(8).lower()
-        domain = domain or random.choice(['gmail.com', 'yahoo.com', 'hotmail.com', 'test.com'])
+        username = _random_lower_string(8)
+        domain = domain or _EMAIL_DOMAINS[_rng.getrandbits(2)]
         return f"{username}@{domain}"
     
+    @staticmethod
+    def random_emails(count: int, domain: str = None) -> List[str]:
+        """
+        Generate many random email addresses in one call.
+        
+        Uses NumPy to draw all usernames and domains at once when it is
+        installed, otherwise falls back to random_email().
+        
+        Args:
+            count: Number of email addresses to generate
+            domain: Optional fixed domain for every address
+        """
+        if np is None:
+            random_email = TestDataGenerator.random_email  # local binding for the loop
+            return [random_email(domain) for _ in range(count)]
+        
+        letter_idx = _np_rng.integers(0, len(_NP_LOWERCASE), size=(count, 8))
+        usernames = _NP_LOWERCASE[letter_idx].view('S8').ravel().tolist()
+        domains = [domain] * count if domain else _np_rng.choice(_EMAIL_DOMAINS, size=count).tolist()
+        return [f"{username.decode('ascii')}@{d}" for username, d in zip(usernames, domains)]
+    
     @staticmethod
     def random_phone(format_type: str = 'us') -> str:
         """
@@ -42,13 +217,8 @@ class TestDataGenerator:
         Args:
             format_type: 'us' for (XXX) XXX-XXXX, 'international' for +1XXXXXXXXXX, 'simple' for XXXXXXXXXX
         """
-        digits = TestDataGenerator.random_digits(10)
-        if format_type == 'us':
-            return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-        elif format_type == 'international':
-            return f"+1{digits}"
-        else:  # simple
-            return digits
+        formatter = _PHONE_FORMATS.get(format_type, _PHONE_FORMATS['simple'])
+        return formatter(f"{_rng.randrange(10 ** 10):010d}")
     
     @staticmethod
     def random_date(days_from_now: int = 0, date_format: str = '%Y-%m-%d') -> str:
@@ -59,47 +229,79 @@ class TestDataGenerator:
             days_from_now: Base offset from today
             date_format: strftime format string (default: YYYY-MM-DD)
         """
-        base_date = datetime.now() + timedelta(days=days_from_now)
-        random_days = random.randint(-365, 365)
-        random_date = base_date + timedelta(days=random_days)
-        return random_date.strftime(date_format)
+        offset = days_from_now + _rng.randint(-365, 365)
+        if date_format == _DEFAULT_DATE_FORMAT:
+            # Integer day arithmetic; no timedelta or strftime needed
+            return date.fromordinal(_today().toordinal() + offset).isoformat()
+        return (_now() + timedelta(days=offset)).strftime(date_format)
+    
+    @staticmethod
+    def random_dates(count: int, days_from_now: int = 0) -> List[str]:
+        """
+        Generate many random YYYY-MM-DD dates in one call.
+        
+        Same distribution as random_date(); uses NumPy datetime64 arithmetic
+        to draw and format all dates at once when it is installed.
+        
+        Args:
+            count: Number of dates to generate
+            days_from_now: Base offset from today
+        """
+        if np is None:
+            # Resolve today once and keep the loop on local names
+            base = _today().toordinal() + days_from_now
+            randint, fromordinal = _rng.randint, date.fromordinal
+            return [fromordinal(base + randint(-365, 365)).isoformat() for _ in range(count)]
+        
+        offsets = _np_rng.integers(-365, 366, size=count) + days_from_now
+        return (np.datetime64(_today(), 'D') + offsets).astype(str).tolist()
     
     @staticmethod
     def random_future_date(max_days: int = 365, date_format: str = '%Y-%m-%d') -> str:
         """Generate a random date in the future."""
-        random_days = random.randint(1, max_days)
-        future_date = datetime.now() + timedelta(days=random_days)
-        return future_date.strftime(date_format)
+        future_date = _now() + timedelta(days=_rng.randint(1, max_days))
+        return _format_date(future_date, date_format)
     
     @staticmethod
     def random_past_date(max_days: int = 365, date_format: str = '%Y-%m-%d') -> str:
         """Generate a random date in the past."""
-        random_days = random.randint(1, max_days)
-        past_date = datetime.now() - timedelta(days=random_days)
-        return past_date.strftime(date_format)
+        past_date = _now() - timedelta(days=_rng.randint(1, max_days))
+        return _format_date(past_date, date_format)
     
     @staticmethod
     def random_number(min_val: int = 1, max_val: int = 1000) -> int:
         """Generate a random number within specified range."""
-        return random.randint(min_val, max_val)
+        return _rng.randint(min_val, max_val)
+    
+    @staticmethod
+    def random_numbers(count: int, min_val: int = 1, max_val: int = 1000) -> List[int]:
+        """
+        Generate many random numbers within specified range (inclusive).
+        
+        Uses NumPy to draw all values at once when it is installed.
+        """
+        if np is None:
+            randint = _rng.randint  # local binding for the loop
+            return [randint(min_val, max_val) for _ in range(count)]
+        return _np_rng.integers(min_val, max_val + 1, size=count).tolist()
     
     @staticmethod
     def random_decimal(min_val: float = 0.0, max_val: float = 1000.0, decimals: int = 2) -> float:
         """Generate a random decimal number."""
-        value = random.uniform(min_val, max_val)
+        value = _rng.uniform(min_val, max_val)
         return round(value, decimals)
     
     @staticmethod
     def random_price(min_val: float = 1.0, max_val: float = 10000.0) -> str:
         """Generate a random price formatted as string with 2 decimals."""
-        price = random.uniform(min_val, max_val)
+        price = _rng.uniform(min_val, max_val)
         return f"{price:.2f}"
     
     @staticmethod
     def random_url(protocol: str = 'https', domain: str = None) -> str:
         """Generate a random URL."""
-        domain = domain or f"{TestDataGenerator.random_string(8).lower()}.com"
-        path = TestDataGenerator.random_string(6).lower()
+        domain = domain or f"{_random_lower_string(8)}.com"
+        path = _random_lower_string(6)
         return f"{protocol}://{domain}/{path}"
     
     @staticmethod
@@ -123,23 +325,27 @@ class TestDataGenerator:
             include_numbers: Include numbers
             include_uppercase: Include uppercase letters
         """
-        chars = string.ascii_lowercase
-        if include_uppercase:
-            chars += string.ascii_uppercase
-        if include_numbers:
-            chars += string.digits
-        if include_special:
-            chars += '!@#$%^&*'
+        key = (include_special, include_numbers, include_uppercase)
+        chars = _PWD_CACHE.get(key)
+        if chars is None:
+            chars = string.ascii_lowercase
+            if include_uppercase:
+                chars += string.ascii_uppercase
+            if include_numbers:
+                chars += string.digits
+            if include_special:
+                chars += _SPECIAL_CHARS
+            _PWD_CACHE[key] = chars
         
-        return ''.join(random.choices(chars, k=length))
+        return ''.join(_choices(chars, k=length))
     
     @staticmethod
     def random_address() -> Dict[str, str]:
         """Generate a random address."""
         return {
-            'street': f"{TestDataGenerator.random_number(1, 9999)} {TestDataGenerator.random_string(8).title()} St",
-            'city': TestDataGenerator.random_string(8).title(),
-            'state': random.choice(['CA', 'NY', 'TX', 'FL', 'IL', 'PA', 'OH']),
+            'street': f"{TestDataGenerator.random_number(1, 9999)} {TestDataGenerator.random_capitalized(8)} St",
+            'city': TestDataGenerator.random_capitalized(8),
+            'state': _rng.choice(['CA', 'NY', 'TX', 'FL', 'IL', 'PA', 'OH']),
             'zip_code': TestDataGenerator.random_digits(5),
             'country': 'USA'
         }
@@ -156,44 +362,48 @@ class TestDataGenerator:
         last_names = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez']
         
         if name_type == 'first':
-            return random.choice(first_names)
+            return _rng.choice(first_names)
         elif name_type == 'last':
-            return random.choice(last_names)
+            return _rng.choice(last_names)
         else:  # full
-            return f"{random.choice(first_names)} {random.choice(last_names)}"
+            return f"{_rng.choice(first_names)} {_rng.choice(last_names)}"
     
     @staticmethod
     def random_company_name() -> str:
         """Generate a random company name."""
         prefixes = ['Tech', 'Global', 'Digital', 'Smart', 'Innovative', 'Advanced', 'Dynamic']
         suffixes = ['Solutions', 'Systems', 'Corp', 'Inc', 'Technologies', 'Enterprises', 'Group']
-        return f"{random.choice(prefixes)} {random.choice(suffixes)}"
+        return f"{_rng.choice(prefixes)} {_rng.choice(suffixes)}"
     
     @staticmethod
     def random_boolean() -> bool:
         """Generate a random boolean value."""
-        return random.choice([True, False])
+        return bool(_rng.getrandbits(1))
     
     @staticmethod
     def random_choice(options: List[Any]) -> Any:
         """Return a random choice from a list of options."""
-        return random.choice(options)
+        return _rng.choice(options)
     
     @staticmethod
     def random_ip_address() -> str:
         """Generate a random IP address."""
-        return '.'.join(str(random.randint(0, 255)) for _ in range(4))
+        r = _rng.getrandbits(32)
+        return f"{(r >> 24) & 255}.{(r >> 16) & 255}.{(r >> 8) & 255}.{r & 255}"
     
     @staticmethod
     def random_uuid() -> str:
-        """Generate a random UUID-like string."""
-        import uuid
-        return str(uuid.uuid4())
+        """Generate a random UUID-like string (RFC 4122 version 4 layout)."""
+        b = bytearray(_rng.randbytes(16))
+        b[6] = (b[6] & 0x0F) | 0x40  # version 4
+        b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = b.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
     
     @staticmethod
     def random_color_hex() -> str:
         """Generate a random color in hex format."""
-        return f"#{random.randint(0, 0xFFFFFF):06x}"
+        return f"#{_rng.getrandbits(24):06x}"
 
 
 class TestHelpers:
@@ -202,8 +412,7 @@ class TestHelpers:
     @staticmethod
     def get_test_file_path(filename: str) -> str:
         """Get the full path to a test file."""
-        test_dir = os.path.dirname(os.path.abspath(__file__))
-        return os.path.join(test_dir, 'test', filename)
+        return os.path.join(_TEST_FILES_DIR, filename)
     
     @staticmethod
     def create_temp_file(content: str, filename: str = None, extension: str = '.txt') -> str:
@@ -220,12 +429,16 @@ class TestHelpers:
         elif not filename.endswith(extension):
             filename = f"{filename}{extension}"
         
-        temp_dir = os.path.join(os.path.dirname(__file__), 'temp')
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        file_path = os.path.join(temp_dir, filename)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Raw fd write: skips the buffered/text wrappers for small payloads
+        data = memoryview(content.encode('utf-8'))
+        file_path, fd = _open_in_temp_dir(
+            filename, lambda path: os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        )
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
         
         return file_path
     
@@ -238,16 +451,11 @@ class TestHelpers:
             data: List of rows, where each row is a list of strings
             filename: Optional filename
         """
-        import csv
-        
         if not filename:
             filename = f"temp_{TestDataGenerator.random_string(6)}.csv"
         
-        temp_dir = os.path.join(os.path.dirname(__file__), 'temp')
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        file_path = os.path.join(temp_dir, filename)
-        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        file_path, f = _open_in_temp_dir(filename, lambda path: open(path, 'w', newline='', encoding='utf-8'))
+        with f:
             writer = csv.writer(f)
             writer.writerows(data)
         
@@ -262,17 +470,12 @@ class TestHelpers:
             data: Dictionary to save as JSON
             filename: Optional filename
         """
-        import json
-        
         if not filename:
             filename = f"temp_{TestDataGenerator.random_string(6)}.json"
         
-        temp_dir = os.path.join(os.path.dirname(__file__), 'temp')
-        os.makedirs(temp_dir, exist_ok=True)
-        
-        file_path = os.path.join(temp_dir, filename)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        file_path, f = _open_in_temp_dir(filename, lambda path: open(path, 'wb'))
+        with f:
+            f.write(_json_dumps(data))
         
         return file_path
     
@@ -285,31 +488,64 @@ class TestHelpers:
     @staticmethod
     def read_json_file(file_path: str) -> Dict[str, Any]:
         """Read and parse a JSON file."""
-        import json
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return _json_loads(f.read())
     
     @staticmethod
     def read_csv_file(file_path: str) -> List[List[str]]:
-        """Read and parse a CSV file."""
-        import csv
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return list(csv.reader(f))
+        """
+        Read and parse a CSV file.
+        
+        Loads every row into memory; prefer iter_csv_file() for large files.
+        """
+        return list(TestHelpers.iter_csv_file(file_path))
+    
+    @staticmethod
+    def iter_csv_file(file_path: str) -> Iterator[List[str]]:
+        """Yield the rows of a CSV file one at a time."""
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            yield from csv.reader(f)
+    
+    @staticmethod
+    def read_csv_numpy(file_path: str, skip_header: bool = False) -> Any:
+        """
+        Read a numeric CSV file into a NumPy array.
+        
+        Args:
+            file_path: Path to a CSV file containing only numbers
+            skip_header: Skip the first row (column names)
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("read_csv_numpy requires numpy (pip install numpy)")
+        return np.loadtxt(file_path, delimiter=',', skiprows=1 if skip_header else 0)
     
     @staticmethod
     def file_exists(file_path: str) -> bool:
         """Check if a file exists."""
-        return os.path.exists(file_path) and os.path.isfile(file_path)
+        try:
+            return stat.S_ISREG(os.stat(file_path).st_mode)
+        except OSError:
+            return False
     
     @staticmethod
     def directory_exists(dir_path: str) -> bool:
         """Check if a directory exists."""
-        return os.path.exists(dir_path) and os.path.isdir(dir_path)
+        try:
+            return stat.S_ISDIR(os.stat(dir_path).st_mode)
+        except OSError:
+            return False
     
     @staticmethod
     def get_file_size(file_path: str) -> int:
-        """Get file size in bytes."""
-        return os.path.getsize(file_path) if TestHelpers.file_exists(file_path) else 0
+        """Get file size in bytes (0 if the path is not a regular file)."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return 0
+        return st.st_size if stat.S_ISREG(st.st_mode) else 0
     
     @staticmethod
     def get_file_extension(file_path: str) -> str:
@@ -335,31 +571,44 @@ class TestHelpers:
         Args:
             condition_func: Function that returns True when condition is met
             timeout: Maximum time to wait in seconds
-            interval: Time between checks in seconds
+            interval: Maximum time between checks in seconds. Polling starts
+                at 10ms and backs off exponentially up to this value.
             
         Returns:
             True if condition was met, False if timeout occurred
         """
-        import time
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        delay = 0.01
         
-        while time.time() - start_time < timeout:
+        while True:
             if condition_func():
                 return True
-            time.sleep(interval)
-        
-        return False
-    
-    @staticmethod
-    def retry_on_exception(func, max_retries: int = 3, delay: float = 1.0, exceptions: tuple = (Exception,)):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, interval, remaining))
+            delay *= 1.5
+    
+    @staticmethod
+    def retry_on_exception(
+        func: Callable[[], T],
+        max_retries: int = 3,
+        delay: float = 1.0,
+        exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+        backoff: float = 2.0,
+        jitter: float = 0.1
+    ) -> T:
         """
         Retry a function if it raises an exception.
         
         Args:
             func: Function to execute
             max_retries: Maximum number of retry attempts
-            delay: Delay between retries in seconds
+            delay: Delay before the first retry in seconds
             exceptions: Tuple of exceptions to catch
+            backoff: Multiplier applied to the delay after each failed attempt
+            jitter: Maximum random fraction added to each delay, so parallel
+                retries don't fire in lockstep
             
         Returns:
             Result of the function if successful
@@ -367,15 +616,13 @@ class TestHelpers:
         Raises:
             The last exception if all retries fail
         """
-        import time
-        
         for attempt in range(max_retries):
             try:
                 return func()
-            except exceptions as e:
+            except exceptions:
                 if attempt == max_retries - 1:
                     raise
-                time.sleep(delay)
+                time.sleep(delay * (backoff ** attempt) * (1 + random.random() * jitter))
     
     @staticmethod
     def sanitize_filename(filename: str) -> str:
@@ -384,20 +631,15 @@ class TestHelpers:
         
         Removes or replaces characters that are not allowed in filenames.
         """
-        # Remove/replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        
-        # Remove leading/trailing spaces and dots
-        filename = filename.strip('. ')
+        # Replace invalid characters in a single pass, then remove leading/trailing spaces and dots
+        filename = filename.translate(_FILENAME_TRANSLATION).strip('. ')
         
         return filename or 'unnamed'
     
     @staticmethod
     def get_timestamp(format_str: str = '%Y%m%d_%H%M%S') -> str:
         """Get current timestamp as formatted string."""
-        return datetime.now().strftime(format_str)
+        return _now().strftime(format_str)
     
     @staticmethod
     def compare_dicts(dict1: Dict, dict2: Dict, ignore_keys: List[str] = None) -> tuple[bool, List[str]]:
@@ -412,24 +654,24 @@ class TestHelpers:
         Returns:
             Tuple of (are_equal, list_of_differences)
         """
-        ignore_keys = ignore_keys or []
-        differences = []
+        ignore = set(ignore_keys or ())
         
-        # Filter out ignored keys
-        filtered_dict1 = {k: v for k, v in dict1.items() if k not in ignore_keys}
-        filtered_dict2 = {k: v for k, v in dict2.items() if k not in ignore_keys}
+        # Key-view set algebra instead of building filtered copies of both dicts
+        keys1 = dict1.keys() - ignore
+        keys2 = dict2.keys() - ignore
+        only_in_second = keys2 - keys1
         
-        # Check for keys only in dict1
-        for key in filtered_dict1:
-            if key not in filtered_dict2:
+        # Iterate the original dicts so differences keep a stable, insertion order
+        differences = []
+        for key in dict1:
+            if key not in keys1:
+                continue
+            if key not in keys2:
                 differences.append(f"Key '{key}' only in first dict")
-            elif filtered_dict1[key] != filtered_dict2[key]:
-                differences.append(f"Key '{key}': {filtered_dict1[key]} != {filtered_dict2[key]}")
+            elif dict1[key] != dict2[key]:
+                differences.append(f"Key '{key}': {dict1[key]} != {dict2[key]}")
         
-        # Check for keys only in dict2
-        for key in filtered_dict2:
-            if key not in filtered_dict1:
-                differences.append(f"Key '{key}' only in second dict")
+        differences.extend(f"Key '{key}' only in second dict" for key in dict2 if key in only_in_second)
         
         return len(differences) == 0, differences
     
@@ -439,18 +681,23 @@ class TestHelpers:
         Merge multiple dictionaries into one.
         Later dictionaries override earlier ones.
         """
-        result = {}
-        for d in dicts:
-            result.update(d)
-        return result
+        return reduce(operator.ior, dicts, {})
     
     @staticmethod
     def cleanup_temp_files() -> None:
         """Clean up temporary files created during tests."""
-        temp_dir = os.path.join(os.path.dirname(__file__), 'temp')
-        if os.path.exists(temp_dir):
-            import shutil
-            shutil.rmtree(temp_dir)
+        try:
+            # Temp dir is normally flat: unlink entries directly, no per-file stat
+            with os.scandir(_TEMP_DIR) as entries:
+                for entry in entries:
+                    os.unlink(entry.path)
+            os.rmdir(_TEMP_DIR)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # Nested directories or other surprises
+            shutil.rmtree(_TEMP_DIR, ignore_errors=True)
+        _ensure_temp_dir.cache_clear()
     
     @staticmethod
     def cleanup_directory(dir_path: str, ignore_errors: bool = True) -> None:
@@ -462,5 +709,4 @@ class TestHelpers:
             ignore_errors: If True, ignore errors during removal
         """
         if os.path.exists(dir_path):
-            import shutil
             shutil.rmtree(dir_path, ignore_errors=ignore_errors)
\ No newline at end of file